@@ -9,6 +9,9 @@ License: BSD 3-clause, see LICENSE.txt
 
 import os
 import re
+import copy
+import time
+import uuid
 import getpass
 import json
 from datetime import datetime
@@ -39,10 +42,19 @@ __version__ = "0.9.2"
 
 
 TOKENFILE = os.path.expanduser("~/.ebrainstoken")
+# number of seconds for which the attribute vocabularies retrieved from the API are reused
+VOCAB_CACHE_TTL = 300
+# number of connections kept open per host by each client session; this should be at least
+# the number of threads sharing the session (see `utils.MAX_WORKERS`), else connections are discarded
+HTTP_POOL_SIZE = 16
 
 
 class ResponseError(Exception):
-    pass
+    """Raised when the validation framework API returns an error; `status_code` is that of the response"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 def handle_response_error(message, response):
@@ -55,7 +67,7 @@ def handle_response_error(message, response):
     else:
         response_text = response.text
     full_message = "{}. Response = {}".format(message, response_text)
-    raise ResponseError(full_message)
+    raise ResponseError(full_message, status_code=response.status_code)
 
 
 def renameNestedJSONKey(iterable, old_key, new_key):
@@ -95,6 +107,13 @@ class BaseClient(object):
         self.verify = True
         self.environment = environment
         self.token = token
+        # reuse a single session so that connections to the API are kept alive;
+        # the session is shared by the threads used for concurrent requests in `utils`
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._vocab_cache = {}
         if environment == "production":
             self.url = "https://model-validation-api.apps.ebrains.eu"
         elif environment == "staging":
@@ -179,8 +198,7 @@ class BaseClient(object):
             token_data[self.username] = {"access_token": self.token}
 
             with open(TOKENFILE, "w") as fp:
-                json.dump(token_data, fp)
-                fp.write("\n")
+                fp.write(json.dumps(token_data) + "\n")
             os.chmod(TOKENFILE, 0o600)
         else:
             self.auth = None
@@ -383,7 +401,7 @@ class BaseClient(object):
     def from_existing(cls, client):
         """Used to easily create a TestLibrary if you already have a ModelCatalog, or vice versa"""
         obj = cls.__new__(cls)
-        for attrname in ("username", "url", "token", "verify", "auth", "environment"):
+        for attrname in ("username", "url", "token", "verify", "auth", "environment", "session", "_vocab_cache"):
             setattr(obj, attrname, getattr(client, attrname))
         obj._set_app_info()
         return obj
@@ -395,10 +413,20 @@ class BaseClient(object):
             url = self.url + "/vocab/" + param.replace("_", "-") + "/"
         else:
             raise Exception("Specified attribute '{}' is invalid. Valid attributes: {}".format(param, valid_params))
-        return requests.get(url, auth=self.auth, verify=self.verify).json()
+        # the vocabularies rarely change, so responses are cached for a short while;
+        # the URL identifies both the attribute and the environment
+        timestamp, values = self._vocab_cache.get(url, (None, None))
+        if timestamp is None or time.monotonic() - timestamp > VOCAB_CACHE_TTL:
+            response = self.session.get(url, auth=self.auth, verify=self.verify)
+            # only successful responses are cached, so that failed requests are retried on the next call
+            if response.status_code != 200:
+                handle_response_error("Error in retrieving attribute options", response)
+            values = response.json()
+            self._vocab_cache[url] = (time.monotonic(), values)
+        return copy.deepcopy(values)
 
     def api_info(self):
-        return requests.get(self.url).json()
+        return self.session.get(self.url).json()
 
 
 class TestLibrary(BaseClient):
@@ -539,7 +567,7 @@ class TestLibrary(BaseClient):
                 url = self.url + "/tests/" + test_id
             else:
                 url = self.url + "/tests/" + quote(str(alias))
-            test_json = requests.get(url, auth=self.auth, verify=self.verify)
+            test_json = self.session.get(url, auth=self.auth, verify=self.verify)
 
         if test_json.status_code != 200:
             handle_response_error("Error in retrieving test", test_json)
@@ -717,7 +745,7 @@ class TestLibrary(BaseClient):
 
         url = self.url + "/tests/"
         url += "?" + urlencode(params, doseq=True) + "&size=" + str(size) + "&from_index=" + str(from_index)
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.session.get(url, auth=self.auth, verify=self.verify)
         if response.status_code != 200:
             handle_response_error("Error listing tests", response)
         tests = response.json()
@@ -856,7 +884,7 @@ class TestLibrary(BaseClient):
 
         url = self.url + "/tests/"
         headers = {"Content-type": "application/json"}
-        response = requests.post(
+        response = self.session.post(
             url,
             data=json.dumps(test_data),
             auth=self.auth,
@@ -1007,7 +1035,7 @@ class TestLibrary(BaseClient):
 
         url = self.url + "/tests/" + test_id
         headers = {"Content-type": "application/json"}
-        response = requests.put(
+        response = self.session.put(
             url,
             data=json.dumps(test_data),
             auth=self.auth,
@@ -1052,7 +1080,7 @@ class TestLibrary(BaseClient):
         else:
             url = self.url + "/tests/" + quote(str(alias))
 
-        test_json = requests.delete(url, auth=self.auth, verify=self.verify)
+        test_json = self.session.delete(url, auth=self.auth, verify=self.verify)
         if test_json.status_code == 403:
             handle_response_error("Only SuperUser accounts can delete data", test_json)
         elif test_json.status_code != 200:
@@ -1118,7 +1146,7 @@ class TestLibrary(BaseClient):
                 url = self.url + "/tests/" + test_id + "/instances/latest"
             else:
                 url = self.url + "/tests/" + quote(str(alias)) + "/instances/latest"
-            response = requests.get(url, auth=self.auth, verify=self.verify)
+            response = self.session.get(url, auth=self.auth, verify=self.verify)
 
         if response.status_code != 200:
             handle_response_error("Error in retrieving test instance", response)
@@ -1171,7 +1199,7 @@ class TestLibrary(BaseClient):
                 url = self.url + "/tests/" + test_id + "/instances/?size=100000"
             else:
                 url = self.url + "/tests/" + quote(str(alias)) + "/instances/?size=100000"
-            response = requests.get(url, auth=self.auth, verify=self.verify)
+            response = self.session.get(url, auth=self.auth, verify=self.verify)
 
         if response.status_code != 200:
             handle_response_error("Error in retrieving test instances", response)
@@ -1237,7 +1265,7 @@ class TestLibrary(BaseClient):
             url = self.url + "/tests/" + quote(str(test_id)) + "/instances/"
 
         headers = {"Content-type": "application/json"}
-        response = requests.post(
+        response = self.session.post(
             url,
             data=json.dumps(instance_data),
             auth=self.auth,
@@ -1324,7 +1352,7 @@ class TestLibrary(BaseClient):
             url = self.url + "/tests/query/instances/" + instance_id
         else:
             url = self.url + "/tests/" + test_identifier + "/instances/?version=" + version
-            response0 = requests.get(url, auth=self.auth, verify=self.verify)
+            response0 = self.session.get(url, auth=self.auth, verify=self.verify)
             if response0.status_code != 200:
                 raise Exception("Invalid test identifier and/or version")
             url = (
@@ -1332,7 +1360,7 @@ class TestLibrary(BaseClient):
             )  # todo: handle more than 1 instance in response
 
         headers = {"Content-type": "application/json"}
-        response = requests.put(
+        response = self.session.put(
             url,
             data=json.dumps(instance_data),
             auth=self.auth,
@@ -1386,11 +1414,11 @@ class TestLibrary(BaseClient):
             url = self.url + "/tests/query/instances/" + instance_id
         else:
             url = self.url + "/tests/" + test_identifier + "/instances/" + version
-            response0 = requests.get(url, auth=self.auth, verify=self.verify)
+            response0 = self.session.get(url, auth=self.auth, verify=self.verify)
             if response0.status_code != 200:
                 raise Exception("Invalid test identifier and/or version")
             url = self.url + "/tests/query/instances/" + response0.json()[0]["id"]
-        response = requests.delete(url, auth=self.auth, verify=self.verify)
+        response = self.session.delete(url, auth=self.auth, verify=self.verify)
         if response.status_code == 403:
             handle_response_error("Only SuperUser accounts can delete data", response)
         elif response.status_code != 200:
@@ -1481,7 +1509,7 @@ class TestLibrary(BaseClient):
             raise Exception("result_id needs to be provided for finding a specific result.")
         else:
             url = self.url + "/results/" + result_id
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.session.get(url, auth=self.auth, verify=self.verify)
         if response.status_code != 200:
             handle_response_error("Error in retrieving result", response)
         result_json = renameNestedJSONKey(response.json(), "project_id", "collab_id")
@@ -1517,7 +1545,7 @@ class TestLibrary(BaseClient):
 
         url = self.url + "/results/"
         url += "?" + urlencode(filters, doseq=True) + "&size=" + str(size) + "&from_index=" + str(from_index)
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.session.get(url, auth=self.auth, verify=self.verify)
         if response.status_code != 200:
             handle_response_error("Error in retrieving results", response)
         result_json = response.json()
@@ -1609,7 +1637,7 @@ class TestLibrary(BaseClient):
         }
 
         headers = {"Content-type": "application/json"}
-        response = requests.post(
+        response = self.session.post(
             url,
             data=json.dumps(result_json),
             auth=self.auth,
@@ -1650,7 +1678,7 @@ class TestLibrary(BaseClient):
             raise Exception("result_id needs to be provided for finding a specific result.")
         else:
             url = self.url + "/results/" + result_id
-        model_image_json = requests.delete(url, auth=self.auth, verify=self.verify)
+        model_image_json = self.session.delete(url, auth=self.auth, verify=self.verify)
         if model_image_json.status_code == 403:
             handle_response_error("Only SuperUser accounts can delete data", model_image_json)
         elif model_image_json.status_code != 200:
@@ -1840,11 +1868,18 @@ class ModelCatalog(BaseClient):
         if model_id == "" and alias == "":
             raise Exception("Model ID or alias needs to be provided for finding a model.")
         elif model_id != "":
+            # check the format locally, to avoid a request that can only fail
+            try:
+                uuid.UUID(str(model_id))
+            except ValueError:
+                raise ValueError(
+                    "Error in retrieving model. '{}' is not a valid model UUID.".format(model_id)
+                ) from None
             url = self.url + "/models/" + model_id
         else:
             url = self.url + "/models/" + quote(str(alias))
 
-        model_json = requests.get(url, auth=self.auth, verify=self.verify)
+        model_json = self.session.get(url, auth=self.auth, verify=self.verify)
         if model_json.status_code != 200:
             handle_response_error("Error in retrieving model", model_json)
         model_json = model_json.json()
@@ -1924,7 +1959,7 @@ class ModelCatalog(BaseClient):
 
         url = self.url + "/models/"
         url += "?" + urlencode(params, doseq=True) + "&size=" + str(size) + "&from_index=" + str(from_index)
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.session.get(url, auth=self.auth, verify=self.verify)
         if response.status_code == 200:
             try:
                 models = response.json()
@@ -2073,7 +2108,7 @@ class ModelCatalog(BaseClient):
         url = self.url + "/models/"
         headers = {"Content-type": "application/json"}
 
-        response = requests.post(
+        response = self.session.post(
             url,
             data=json.dumps(model_data),
             auth=self.auth,
@@ -2218,7 +2253,7 @@ class ModelCatalog(BaseClient):
 
         headers = {"Content-type": "application/json"}
         url = self.url + "/models/" + model_id
-        response = requests.put(
+        response = self.session.put(
             url,
             data=json.dumps(model_data),
             auth=self.auth,
@@ -2263,7 +2298,7 @@ class ModelCatalog(BaseClient):
         else:
             url = self.url + "/models/" + quote(str(alias))
 
-        model_json = requests.delete(url, auth=self.auth, verify=self.verify)
+        model_json = self.session.delete(url, auth=self.auth, verify=self.verify)
         if model_json.status_code == 403:
             handle_response_error("Only SuperUser accounts can delete data", model_json)
         elif model_json.status_code != 200:
@@ -2363,7 +2398,7 @@ class ModelCatalog(BaseClient):
                 url = self.url + "/models/" + model_id + "/instances/?version=" + version
             else:
                 url = self.url + "/models/" + quote(str(alias)) + "/instances/?version=" + version
-            model_instance_json = requests.get(url, auth=self.auth, verify=self.verify)
+            model_instance_json = self.session.get(url, auth=self.auth, verify=self.verify)
         if model_instance_json.status_code != 200:
             handle_response_error("Error in retrieving model instance", model_instance_json)
         model_instance_json = model_instance_json.json()
@@ -2534,7 +2569,7 @@ class ModelCatalog(BaseClient):
                 url = self.url + "/models/" + model_id + "/instances/?size=100000"
             else:
                 url = self.url + "/models/" + quote(str(alias)) + "/instances/?size=100000"
-            model_instances_json = requests.get(url, auth=self.auth, verify=self.verify)
+            model_instances_json = self.session.get(url, auth=self.auth, verify=self.verify)
         if model_instances_json.status_code != 200:
             handle_response_error("Error in retrieving model instances", model_instances_json)
         model_instances_json = model_instances_json.json()
@@ -2619,7 +2654,7 @@ class ModelCatalog(BaseClient):
             url = self.url + "/models/" + quote(str(model_id)) + "/instances/"
 
         headers = {"Content-type": "application/json"}
-        response = requests.post(
+        response = self.session.post(
             url,
             data=json.dumps(instance_data),
             auth=self.auth,
@@ -2774,7 +2809,7 @@ class ModelCatalog(BaseClient):
             url = self.url + "/models/query/instances/" + instance_id
         else:
             model_identifier = quote(str(model_id or alias))
-            response0 = requests.get(
+            response0 = self.session.get(
                 self.url + f"/models/{model_identifier}/instances/?version={version}",
                 auth=self.auth,
                 verify=self.verify,
@@ -2790,7 +2825,7 @@ class ModelCatalog(BaseClient):
             instance_data.pop(key)
 
         headers = {"Content-type": "application/json"}
-        response = requests.put(
+        response = self.session.put(
             url,
             data=json.dumps(instance_data),
             auth=self.auth,
@@ -2846,7 +2881,7 @@ class ModelCatalog(BaseClient):
                 url = self.url + "/models/query/instances/" + instance_id
         else:
             raise NotImplementedError("Need to retrieve instance to get id")
-        model_instance_json = requests.delete(url, auth=self.auth, verify=self.verify)
+        model_instance_json = self.session.delete(url, auth=self.auth, verify=self.verify)
         if model_instance_json.status_code == 403:
             handle_response_error("Only SuperUser accounts can delete data", model_instance_json)
         elif model_instance_json.status_code != 200:
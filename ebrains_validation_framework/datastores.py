@@ -22,6 +22,7 @@ import mimetypes
 from warnings import warn
 from pathlib import Path
 from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -29,6 +30,9 @@ import ebrains_drive
 
 mimetypes.init()
 
+# cap on simultaneous file downloads, to avoid overloading remote servers
+MAX_DOWNLOAD_WORKERS = 8
+
 
 class FileSystemDataStore(object):
     """
@@ -184,7 +188,8 @@ class CollabBucketDataStore(_CollabDataStore):
             self.authorize(self._auth)
 
         if not overwrite:
-            existing_files = self.bucket.ls()
+            # `ls()` returns a generator of file objects; collect the names once for fast lookup
+            existing_files = {f.name for f in self.bucket.ls(prefix=self.base_folder or None)}
 
         relative_paths = self._get_relative_paths(file_paths)
         uploaded_file_paths = []
@@ -227,25 +232,8 @@ class HTTPDataStore(object):
             remote_paths = [remote_paths]
         local_paths = []
 
-        if not overwrite:
-            # confirm that each target filepath doesn't already exist
-            for url in remote_paths:
-                req = requests.head(url)
-                if req.status_code == 200:
-                    if url.startswith("https://senselab.med.yale.edu/modeldb/") and url.endswith(
-                        "&mime=application/zip"
-                    ):
-                        filename = req.headers["Content-Disposition"].split("filename=")[1]
-                    else:
-                        filename = url.split("/")[-1]
-                    local_path = os.path.join(local_directory, filename)
-                    # local_path = os.path.join(local_directory, os.path.basename(urlparse(url).path))
-                    if os.path.exists(local_path):
-                        raise FileExistsError(
-                            f"Target file path `{local_path}` already exists!\n"
-                            "Set `overwrite=True` if you wish overwrite existing files!"
-                        )
-
+        # resolve the local file path for each URL, using a single HEAD request per URL
+        download_targets = []
         for url in remote_paths:
             req = requests.head(url)
             if req.status_code == 200:
@@ -255,11 +243,37 @@ class HTTPDataStore(object):
                     filename = url.split("/")[-1]
                 local_path = os.path.join(local_directory, filename)
                 # local_path = os.path.join(local_directory, os.path.basename(urlparse(url).path))
-                Path(os.path.dirname(local_path)).mkdir(parents=True, exist_ok=True)
-                filename, headers = urlretrieve(url, local_path)
-                local_paths.append(filename)
+                # confirm that the target filepath doesn't already exist
+                if not overwrite and os.path.exists(local_path):
+                    raise FileExistsError(
+                        f"Target file path `{local_path}` already exists!\n"
+                        "Set `overwrite=True` if you wish overwrite existing files!"
+                    )
+                download_targets.append((url, local_path))
             else:
                 print(f"Unable to download file from {url}. Error message {req.text}")
+
+        # several URLs may resolve to the same local file; as when downloading one after the other,
+        # the last of these is kept, and each local file is only written by a single download
+        unique_targets = {}
+        for url, local_path in download_targets:
+            if local_path in unique_targets:
+                warn(f"Files from {unique_targets[local_path]} and {url} have the same target path `{local_path}`")
+            unique_targets[local_path] = url
+
+        def _download_one(local_path):
+            Path(os.path.dirname(local_path)).mkdir(parents=True, exist_ok=True)
+            filename, headers = urlretrieve(unique_targets[local_path], local_path)
+            return filename
+
+        # downloads are network-bound, so overlap them
+        if len(unique_targets) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(unique_targets))) as executor:
+                filenames = dict(zip(unique_targets, executor.map(_download_one, unique_targets)))
+        else:
+            filenames = {local_path: _download_one(local_path) for local_path in unique_targets}
+        # one entry per URL, in the order of `remote_paths`
+        local_paths.extend(filenames[local_path] for url, local_path in download_targets)
         return local_paths
 
     def load_data(self, remote_path):
@@ -165,6 +165,10 @@ var jsonTreeViewer = (function() {
             }
             
             tree.loadData(temp);
+        },
+
+        load : function(data) {
+            tree.loadData(data);
         }
     };
 })();
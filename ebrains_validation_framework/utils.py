@@ -22,24 +22,150 @@ Display score matrix in web browser       :meth:`display_score_matrix_html`
 """
 
 import os
+import time
 import uuid
 import json
+import base64
 import math
-import mimetypes
 import pickle
-import webbrowser
-import collections
-import pkg_resources
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from urllib.parse import urlparse
 
-import sciunit
-
-from . import ModelCatalog, TestLibrary
+from . import ModelCatalog, TestLibrary, ResponseError, HTTP_POOL_SIZE
 from .datastores import URI_SCHEME_MAP, CollabDriveDataStore, CollabBucketDataStore
 
+# use the faster orjson encoder/decoder if available (installed via the `fast` extra)
+try:
+    import orjson
+
+    def _json_dumps(obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    def _json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library, e.g. it rejects NaN values
+            return json.loads(data)
+
+except ImportError:
+
+    def _json_dumps(obj, indent=False):
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _json_loads(data):
+        return json.loads(data)
+
+
+# compress the pickled test results if zstandard is available (installed via the `fast` extra);
+# compressed files are given a `.zst` extension, so that plain `.pkl` files remain plain pickles
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# large JSON observation files are parsed incrementally if ijson is available (installed via the `fast` extra)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_LARGE_JSON_SIZE = 32 * 1024 * 1024
+
+
+def _save_test_result(score, file_path):
+    """
+    Pickles `score` to `file_path`, compressed if zstandard is available, in which case
+    `.zst` is appended to the file name. Returns the path of the file written.
+    """
+    file_path = Path(file_path)
+    data = pickle.dumps(score, protocol=pickle.HIGHEST_PROTOCOL)
+    if zstandard:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+        file_path = file_path.with_name(file_path.name + ".zst")
+    with open(file_path, "wb") as file:
+        file.write(data)
+    return file_path
+
+
+def _load_test_result(file_path):
+    with open(file_path, "rb") as file:
+        data = file.read()
+    # uncompressed result files, e.g. from older versions, are loaded directly
+    if data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ImportError("This test result file is compressed. Please install the following package: zstandard")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return pickle.loads(data)
+
+
+# maximum number of concurrent requests made to the validation framework API,
+# matching the number of connections each client session keeps open
+MAX_WORKERS = HTTP_POOL_SIZE
+
+# response status codes indicating that a requested entry does not exist, or that its id is malformed
+INVALID_ID_STATUS_CODES = (400, 404, 422)
+
+_SCRIPT_DIR = os.path.dirname(__file__)
+_DATA_JS_PATH = os.path.join(_SCRIPT_DIR, "jsonTreeViewer/data.js")
+_INDEX_HTM_PATH = os.path.join(_SCRIPT_DIR, "jsonTreeViewer/index.htm")
+
+# authenticated clients, keyed by (username, environment), reused across calls
+_clients = {}
+
+
+def _fetch_concurrently(func, ids):
+    """
+    Calls `func` for each unique entry in `ids`, using concurrent requests.
+    Returns a dict mapping each id to the corresponding output.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(zip(unique_ids, executor.map(func, unique_ids)))
+
+
+def _token_expired(token, margin=60):
+    """
+    Checks the expiry time stored in the (JWT) access token, without contacting the server.
+    Tokens that cannot be decoded are treated as expired.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        expiry = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+    except Exception:
+        return True
+    return expiry < time.time() + margin
+
+
+def _get_client(cls, username, password, environment, client_obj=None):
+    """
+    Returns a ModelCatalog or TestLibrary object (as specified by `cls`).
+    If `client_obj` is not given, a previously authenticated client for the same
+    username and environment is reused as long as its token has not expired.
+    Note that a cached client is reused regardless of the `password` passed in;
+    use `_clients.clear()` to discard the cached clients and force re-authentication.
+    """
+    if client_obj:
+        return cls.from_existing(client_obj)
+    key = (username, environment)
+    client = _clients.get(key)
+    if client is None or _token_expired(client.token):
+        client = cls(username, password, environment=environment)
+        _clients[key] = client
+    return cls.from_existing(client)
+
 
 def view_json_tree(data):
     """Displays the JSON tree structure inside the web browser
@@ -64,12 +190,10 @@ def view_json_tree(data):
     >>> utils.view_json_tree(model)
     """
 
-    _make_js_file(data)
+    import webbrowser
 
-    script_dir = os.path.dirname(__file__)
-    rel_path = "jsonTreeViewer/index.htm"
-    abs_file_path = os.path.join(script_dir, rel_path)
-    webbrowser.open(abs_file_path, new=2)
+    _make_js_file(data)
+    webbrowser.open(_INDEX_HTM_PATH, new=2)
 
 
 def _make_js_file(data):
@@ -78,13 +202,9 @@ def _make_js_file(data):
     This eliminates cross-origin issues with loading local data files (e.g. via jQuery)
     """
 
-    script_dir = os.path.dirname(__file__)
-    rel_path = "jsonTreeViewer/data.js"
-    abs_file_path = os.path.join(script_dir, rel_path)
-    with open(abs_file_path, "w") as outfile:
-        outfile.write("var data = '")
-        json.dump(data, outfile)
-        outfile.write("'")
+    with open(_DATA_JS_PATH, "wb") as outfile:
+        # JSON is a valid JavaScript expression, so the browser does not need to parse it separately
+        outfile.write(b"var data = " + _json_dumps(data) + b";")
 
 
 def prepare_run_test_offline(
@@ -154,10 +274,7 @@ def prepare_run_test_offline(
     >>> test_config_file = utils.prepare_run_test_offline(username="shailesh", test_alias="CDT-5", test_version="5.0")
     """
 
-    if client_obj:
-        test_library = TestLibrary.from_existing(client_obj)
-    else:
-        test_library = TestLibrary(username, password, environment=environment)
+    test_library = _get_client(TestLibrary, username, password, environment, client_obj)
 
     if test_instance_id == "" and test_id == "" and test_alias == "":
         raise Exception("test_instance_id or test_id or test_alias needs to be provided for finding test.")
@@ -200,11 +317,25 @@ def prepare_run_test_offline(
 
     # Save test info to config file
     test_config_file = os.path.join(base_folder, "test_config.json")
-    with open(test_config_file, "w") as file:
-        file.write(json.dumps(test_info, indent=4))
+    with open(test_config_file, "wb") as file:
+        file.write(_json_dumps(test_info, indent=True))
     return test_config_file
 
 
+def _load_observation(observation_path):
+    """
+    Reads the observation data from `observation_path`. JSON files are parsed (incrementally,
+    if ijson is available and the file is larger than `_LARGE_JSON_SIZE`); other files are returned as bytes.
+    """
+    with open(observation_path, "rb") as file:
+        if observation_path.suffix.lower() != ".json":
+            return file.read()
+        if ijson and observation_path.stat().st_size > _LARGE_JSON_SIZE:
+            # avoid holding both the raw file contents and the parsed data in memory
+            return next(ijson.items(file, "", use_float=True))
+        return _json_loads(file.read())
+
+
 def run_test_offline(model="", test_config_file=""):
     """Run the validation test
 
@@ -228,20 +359,22 @@ def run_test_offline(model="", test_config_file=""):
     Returns
     -------
     path
-        The absolute path of the generated test result file
+        The absolute path of the generated test result file. This is a pickle file (`.pkl`),
+        or a zstandard-compressed pickle file (`.pkl.zst`) if the `zstandard` package is installed.
 
     Examples
     --------
     >>> test_result_file = utils.run_test_offline(model=model, test_config_file=test_config_file)
     """
 
-    if not os.path.isfile(test_config_file):
+    test_config_path = Path(test_config_file).resolve()
+    if not test_config_path.is_file():
         raise Exception("'test_config_file' should direct to file describing the test configuration.")
-    base_folder = os.path.dirname(os.path.realpath(test_config_file))
+    base_folder = test_config_path.parent
 
     # Load the test info from config file
-    with open(test_config_file) as file:
-        test_info = json.load(file)
+    with open(test_config_path, "rb") as file:
+        test_info = _json_loads(file.read())
 
     # Identify test class path
     path_parts = test_info["test_instance_path"].split(".")
@@ -251,11 +384,7 @@ def run_test_offline(model="", test_config_file=""):
     test_cls = getattr(test_module, cls_name)
 
     # Read observation data required by test
-    with open(os.path.join(base_folder, test_info["test_observation_file"]), "rb") as file:
-        observation_data = file.read()
-    content_type = mimetypes.guess_type(test_info["test_observation_file"])[0]
-    if content_type == "application/json":
-        observation_data = json.loads(observation_data)
+    observation_data = _load_observation(base_folder / test_info["test_observation_file"])
 
     # Create the :class:`sciunit.Test` instance
     params = test_info["params"]
@@ -274,6 +403,9 @@ def run_test_offline(model="", test_config_file=""):
     print("----------------------------------------------")
 
     # Check the model
+    # sciunit is imported here, as it is slow to import and only needed when running tests
+    import sciunit
+
     if not isinstance(model, sciunit.Model):
         raise TypeError("`model` is not a sciunit Model!")
     print("----------------------------------------------")
@@ -290,9 +422,7 @@ def run_test_offline(model="", test_config_file=""):
     print("----------------------------------------------")
     print("Score: ", score.score)
     if "figures" in score.related_data:
-        print("Output files: ")
-        for item in score.related_data["figures"]:
-            print(item)
+        print("Output files: \n" + "\n".join(map(str, score.related_data["figures"])))
     print("----------------------------------------------")
 
     score.runtime = str(int(math.ceil((t_end - t_start).total_seconds()))) + " s"
@@ -319,15 +449,11 @@ def run_test_offline(model="", test_config_file=""):
     if hasattr(model, "model_version"):
         score_obj.model.model_version = model.model_version
 
-    Path(os.path.join(base_folder, "results")).mkdir(parents=True, exist_ok=True)
-    test_result_file = os.path.join(
-        base_folder,
-        "results",
-        "result__" + model.name + "__" + datetime.now().strftime("%Y%m%d%H%M%S") + ".pkl",
-    )
-    with open(test_result_file, "wb") as file:
-        pickle.dump(score_obj, file)
-    return test_result_file
+    results_folder = base_folder / "results"
+    results_folder.mkdir(parents=True, exist_ok=True)
+    test_result_file = results_folder / f"result__{model.name}__{datetime.now().strftime('%Y%m%d%H%M%S')}.pkl"
+    test_result_file = _save_test_result(score_obj, test_result_file)
+    return str(test_result_file)
 
 
 def upload_test_result(
@@ -391,19 +517,15 @@ def upload_test_result(
         raise Exception("'test_result_file' should direct to file containg the test result data.")
 
     # Load result info from file
-    with open(test_result_file, "rb") as file:
-        score = pickle.load(file)
+    score = _load_test_result(test_result_file)
 
     if not register_result:
         return None, score.score
 
     # Register the result with the EBRAINS validation framework
-    if client_obj:
-        model_catalog = ModelCatalog.from_existing(client_obj)
-    else:
-        model_catalog = ModelCatalog(username, password, environment=environment)
-    model_instance_uuid = model_catalog.find_model_instance_else_add(score.model)["id"]
-    model_instance_json = model_catalog.get_model_instance(instance_id=model_instance_uuid)
+    model_catalog = _get_client(ModelCatalog, username, password, environment, client_obj)
+    # the returned model instance already has the model id, so no need to retrieve it again
+    model_instance_json = model_catalog.find_model_instance_else_add(score.model)
     model_json = model_catalog.get_model(model_id=model_instance_json["model_id"])
     model_host_collab_id = model_json["collab_id"]
     model_name = model_json["name"]
@@ -415,7 +537,7 @@ def upload_test_result(
     # Check if result with same hash has already been uploaded for
     # this (model instance, test instance) combination; if yes, don't register result
     # result_json = {
-    #                 "model_instance_id": model_instance_uuid,
+    #                 "model_instance_id": model_instance_json["id"],
     #                 "test_instance_id": score.test.uuid,
     #                 "score": score.score,
     #                 "runtime": score.runtime,
@@ -424,16 +546,18 @@ def upload_test_result(
     #               }
     # score.score_hash = str(hash(json.dumps(result_json, sort_keys=True, default = str)))
     test_library = TestLibrary.from_existing(model_catalog)
-    # results = test_library.list_results(model_instance_id=model_instance_uuid, test_instance_id=score.test.uuid)["results"]
+    # results = test_library.list_results(model_instance_id=model_instance_json["id"], test_instance_id=score.test.uuid)["results"]
     # duplicate_results =  [x["id"] for x in results if x["hash"] == score.score_hash]
     # if duplicate_results:
     #     raise Exception("An identical result has already been registered on the validation framework.\nExisting Result UUID = {}".format(", ".join(duplicate_results)))
 
     # `.replace(" ", "_")` used to avoid Collab storage path errors due to spaces
+    # timestamp taken once, so that the date and time in the folder name always match
+    timestamp = datetime.now()
     collab_folder = "validation_results/{}/{}_{}".format(
-        datetime.now().strftime("%Y-%m-%d"),
+        timestamp.strftime("%Y-%m-%d"),
         model_name.replace(" ", "_"),
-        datetime.now().strftime("%Y%m%d-%H%M%S"),
+        timestamp.strftime("%Y%m%d-%H%M%S"),
     )
     if storage_type == "drive":
         collab_storage = CollabDriveDataStore(
@@ -506,7 +630,9 @@ def run_test(
 
     Note
     ----
-    Should be run on node having access to external URLs (i.e. with internet access)
+    Should be run on node having access to external URLs (i.e. with internet access).
+    Authentication is done once, and the network is only accessed when preparing
+    the test and when registering the result.
 
     Returns
     -------
@@ -522,6 +648,9 @@ def run_test(
                                        test_version="1.0", storage_collab_id="8123", register_result=True)
     """
 
+    # authenticate once, and share the client between the different steps
+    client_obj = _get_client(TestLibrary, username, password, environment, client_obj)
+
     test_config_file = prepare_run_test_offline(
         username=username,
         password=password,
@@ -635,10 +764,7 @@ def run_test_standalone(
                                                   test_alias="CDT-5", test_version="5.0")
     """
 
-    if client_obj:
-        test_library = TestLibrary.from_existing(client_obj)
-    else:
-        test_library = TestLibrary(username, password, environment=environment)
+    test_library = _get_client(TestLibrary, username, password, environment, client_obj)
 
     if test_instance_id == "" and test_id == "" and test_alias == "":
         raise Exception("test_instance_id or test_id or test_alias needs to be provided for finding test.")
@@ -702,6 +828,9 @@ def run_test_standalone(
     print("----------------------------------------------")
 
     # Check the model
+    # sciunit is imported here, as it is slow to import and only needed when running tests
+    import sciunit
+
     if not isinstance(model, sciunit.Model):
         raise TypeError("`model` is not a sciunit Model!")
     print("----------------------------------------------")
@@ -717,9 +846,7 @@ def run_test_standalone(
     print("----------------------------------------------")
     print("Score: ", score.score)
     if "figures" in score.related_data:
-        print("Output files: ")
-        for item in score.related_data["figures"]:
-            print(item)
+        print("Output files: \n" + "\n".join(map(str, score.related_data["figures"])))
     print("----------------------------------------------")
 
     score.runtime = str(int(math.ceil((t_end - t_start).total_seconds()))) + " s"
@@ -730,12 +857,9 @@ def run_test_standalone(
         return None, score
 
     # Register the result with the EBRAINS validation framework
-    if client_obj:
-        model_catalog = ModelCatalog.from_existing(client_obj)
-    else:
-        model_catalog = ModelCatalog(username, password, environment=environment)
-    model_instance_uuid = model_catalog.find_model_instance_else_add(score.model)["id"]
-    model_instance_json = model_catalog.get_model_instance(instance_id=model_instance_uuid)
+    model_catalog = ModelCatalog.from_existing(test_library)
+    # the returned model instance already has the model id, so no need to retrieve it again
+    model_instance_json = model_catalog.find_model_instance_else_add(score.model)
     model_json = model_catalog.get_model(model_id=model_instance_json["model_id"])
     model_host_collab_id = model_json["collab_id"]
     model_name = model_json["name"]
@@ -747,7 +871,7 @@ def run_test_standalone(
     # Check if result with same hash has already been uploaded for
     # this (model instance, test instance) combination; if yes, don't register result
     # result_json = {
-    #                 "model_instance_id": model_instance_uuid,
+    #                 "model_instance_id": model_instance_json["id"],
     #                 "test_instance_id": score.test.uuid,
     #                 "score": score.score,
     #                 "runtime": score.runtime,
@@ -756,16 +880,18 @@ def run_test_standalone(
     #               }
     # score.score_hash = str(hash(json.dumps(result_json, sort_keys=True, default = str)))
     test_library = TestLibrary.from_existing(model_catalog)
-    # results = test_library.list_results(model_instance_id=model_instance_uuid, test_instance_id=score.test.uuid)["results"]
+    # results = test_library.list_results(model_instance_id=model_instance_json["id"], test_instance_id=score.test.uuid)["results"]
     # duplicate_results =  [x["id"] for x in results if x["hash"] == score.score_hash]
     # if duplicate_results:
     #     raise Exception("An identical result has already been registered on the validation framework.\nExisting Result UUID = {}".format(", ".join(duplicate_results)))
 
     # `.replace(" ", "_")` used to avoid Collab storage path errors due to spaces
+    # timestamp taken once, so that the date and time in the folder name always match
+    timestamp = datetime.now()
     collab_folder = "validation_results/{}/{}_{}".format(
-        datetime.now().strftime("%Y-%m-%d"),
+        timestamp.strftime("%Y-%m-%d"),
         model_name.replace(" ", "_"),
-        datetime.now().strftime("%Y%m%d-%H%M%S"),
+        timestamp.strftime("%Y%m%d-%H%M%S"),
     )
 
     if storage_type == "drive":
@@ -840,16 +966,48 @@ def generate_HTML_report(
     >>> report_path, valid_uuids = utils.generate_HTML_report(html_report_path="report.html")
     """
 
+    output = _generate_HTML_report(
+        username=username,
+        password=password,
+        environment=environment,
+        model_list=model_list,
+        model_instance_list=model_instance_list,
+        test_list=test_list,
+        test_instance_list=test_instance_list,
+        result_list=result_list,
+        show_links=show_links,
+        client_obj=client_obj,
+    )
+    if output is None:
+        return
+    report_path, valid_result_uuids, _ = output
+    return report_path, valid_result_uuids
+
+
+def _generate_HTML_report(
+    username,
+    password,
+    environment,
+    model_list,
+    model_instance_list,
+    test_list,
+    test_instance_list,
+    result_list,
+    show_links,
+    client_obj,
+):
+    """
+    Generates the HTML report as described in :meth:`generate_HTML_report`.
+    Additionally returns the rendered HTML, so that it can be reused without reading back the file.
+    """
+
     try:
-        from jinja2 import Environment, FileSystemLoader
+        import jinja2  # noqa: F401
     except ImportError:
         print("Please install the following package: Jinja2")
         return
 
-    if client_obj:
-        model_catalog = ModelCatalog.from_existing(client_obj)
-    else:
-        model_catalog = ModelCatalog(username, password, environment=environment)
+    model_catalog = _get_client(ModelCatalog, username, password, environment, client_obj)
     test_library = TestLibrary.from_existing(model_catalog)
 
     # retrieve all model instances from specified models
@@ -875,16 +1033,19 @@ def generate_HTML_report(
                 test_instance_list.append(item["id"])
 
     # extend results list to include all results corresponding to above
-    # identified model instances and test instances
-    for item in model_instance_list:
-        results_json = test_library.list_results(model_instance_id=item)
-        result_list.extend([r["id"] for r in results_json])
-    for item in test_instance_list:
-        results_json = test_library.list_results(test_instance_id=item)
-        result_list.extend([r["id"] for r in results_json])
+    # identified model instances and test instances (retrieved concurrently)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        model_instance_results = executor.map(
+            lambda item: test_library.list_results(model_instance_id=item), model_instance_list
+        )
+        test_instance_results = executor.map(
+            lambda item: test_library.list_results(test_instance_id=item), test_instance_list
+        )
+        for results_json in list(model_instance_results) + list(test_instance_results):
+            result_list.extend([r["id"] for r in results_json])
 
     # remove duplicate result UUIDs
-    result_list = list(collections.OrderedDict.fromkeys(result_list).keys())
+    result_list = list(dict.fromkeys(result_list))
 
     # utilize each result entry
     result_summary_table = []  # list of dicts, each with 4 keys -> result_id, model_label, test_label, score
@@ -894,13 +1055,49 @@ def generate_HTML_report(
     list_tests = []
     list_test_instances = []
     valid_result_uuids = []
+    invalid_result_uuids = []
+
+    def get_result(r_id):
+        try:
+            return test_library.get_result(result_id=r_id)
+        except ResponseError as err:
+            # only unknown or malformed result UUIDs are reported as invalid;
+            # other errors (e.g. authorization, rate limiting, server errors) are raised
+            if err.status_code in INVALID_ID_STATUS_CODES:
+                return None
+            raise
+
+    # several results will often share the same model/test (instances), so we first
+    # collect the unique identifiers at each level, and retrieve each entry only once
+    results = _fetch_concurrently(get_result, result_list)
+    valid_results = [result for result in results.values() if result is not None]
+    model_instances = _fetch_concurrently(
+        lambda instance_id: model_catalog.get_model_instance(instance_id=instance_id),
+        [result["model_instance_id"] for result in valid_results],
+    )
+    test_instances = _fetch_concurrently(
+        lambda instance_id: test_library.get_test_instance(instance_id=instance_id),
+        [result["test_instance_id"] for result in valid_results],
+    )
+    models = _fetch_concurrently(
+        lambda model_id: model_catalog.get_model(model_id=model_id),
+        [model_instance["model_id"] for model_instance in model_instances.values()],
+    )
+    tests = _fetch_concurrently(
+        lambda test_id: test_library.get_test_definition(test_id=test_id),
+        [test_instance["test_id"] for test_instance in test_instances.values()],
+    )
+
     for r_id in result_list:
-        result = test_library.get_result(result_id=r_id)
+        result = results[r_id]
+        if result is None:
+            invalid_result_uuids.append(r_id)
+            continue
+        model_instance = model_instances[result["model_instance_id"]]
+        test_instance = test_instances[result["test_instance_id"]]
+        model = models[model_instance["model_id"]]
+        test = tests[test_instance["test_id"]]
         valid_result_uuids.append(r_id)
-        model_instance = model_catalog.get_model_instance(instance_id=result["model_instance_id"])
-        test_instance = test_library.get_test_instance(instance_id=result["test_instance_id"])
-        model = model_catalog.get_model(model_id=model_instance["model_id"])
-        test = test_library.get_test_definition(test_id=test_instance["test_id"])
 
         list_results.append(result)
         list_models.append(model)
@@ -908,10 +1105,8 @@ def generate_HTML_report(
         list_tests.append(test)
         list_test_instances.append(test_instance)
 
-        model_label = (
-            (model["alias"] if model["alias"] else model["name"]) + " (" + str(model_instance["version"]) + ")"
-        )
-        test_label = (test["alias"] if test["alias"] else test["name"]) + " (" + str(test_instance["version"]) + ")"
+        model_label = f"{model['alias'] or model['name']} ({model_instance['version']})"
+        test_label = f"{test['alias'] or test['name']} ({test_instance['version']})"
         if show_links:
             result_url = "https://model-catalog.apps.ebrains.eu/#result_id.{}".format(r_id)
             model_url = "https://model-catalog.apps.ebrains.eu/#model_id.{}".format(model["id"])
@@ -934,12 +1129,14 @@ def generate_HTML_report(
                 }
             )
 
+    if invalid_result_uuids:
+        print("The following result UUIDs were invalid, and have been excluded from the report:")
+        print("\n".join(invalid_result_uuids))
+
     timestamp = datetime.now()
-    report_name = str("EBRAINS_VF_Report_" + timestamp.strftime("%Y%m%d-%H%M%S") + ".html")
+    report_name = f"EBRAINS_VF_Report_{timestamp.strftime('%Y%m%d-%H%M%S')}.html"
 
-    template_path = pkg_resources.resource_filename("ebrains_validation_framework", "templates/report_template.html")
-    env = Environment(loader=FileSystemLoader(os.path.dirname(template_path)))
-    template = env.get_template(os.path.basename(template_path))
+    template = _get_report_template()
 
     template_vars = {
         "report_name": report_name,
@@ -955,7 +1152,18 @@ def generate_HTML_report(
 
     with open(report_name, "w") as outfile:
         outfile.write(html_out)
-    return os.path.abspath(report_name), valid_result_uuids
+    return os.path.abspath(report_name), valid_result_uuids, html_out
+
+
+@lru_cache(maxsize=None)
+def _get_report_template():
+    """Loads and compiles the HTML report template; done only once per session"""
+    import pkg_resources
+    from jinja2 import Environment, FileSystemLoader
+
+    template_path = pkg_resources.resource_filename("ebrains_validation_framework", "templates/report_template.html")
+    env = Environment(loader=FileSystemLoader(os.path.dirname(template_path)))
+    return env.get_template(os.path.basename(template_path))
 
 
 def generate_PDF_report(
@@ -1045,9 +1253,13 @@ def generate_PDF_report(
     if not html_report_path:
         params.pop("html_report_path")
         params.pop("only_results")
-        html_report_path, valid_result_uuids = generate_HTML_report(**params)
-    with open(html_report_path, "r") as html_file:
-        html_string = html_file.read()
+        output = _generate_HTML_report(**params)
+        if output is None:
+            return
+        html_report_path, valid_result_uuids, html_string = output
+    else:
+        with open(html_report_path, "r") as html_file:
+            html_string = html_file.read()
 
     # Exchanging the order of these JS files is sufficient to remove the
     # 'tabs' organization of info in HTML file to a sequential layout
@@ -1058,7 +1270,14 @@ def generate_PDF_report(
 
     if only_results:
         # remove tabs navigation bar
-        html_soup = BeautifulSoup(html_string, "html.parser")
+        # prefer the C-based lxml parser (installed via the `fast` extra) over the pure-Python html.parser
+        try:
+            import lxml  # noqa: F401
+
+            html_parser = "lxml"
+        except ImportError:
+            html_parser = "html.parser"
+        html_soup = BeautifulSoup(html_string, html_parser)
         for item in html_soup.findAll("ul", {"class": "tabs"}):
             item.parent.decompose()
         # remove model and test tabs
@@ -1100,12 +1319,13 @@ def generate_score_matrix(
     show_links=True,
     round_places=None,
     client_obj=None,
+    pretty=False,
 ):
-    """Generates a styled pandas dataframe with score matrix
+    """Generates a score matrix for the specified test results
 
-    This method will generate a styled pandas dataframe for the specified test results.
-    Each row will correspond to a particular model instance, and the columns
-    correspond to the test instances.
+    This method will generate a score matrix, rendered as an HTML table with clickable
+    scores, for the specified test results. Each row will correspond to a particular
+    model instance, and the columns correspond to the test instances.
 
     Parameters
     ----------
@@ -1138,24 +1358,33 @@ def generate_score_matrix(
         Avoids need for repeated authentications; improves performance. Also, helps minimize
         being blocked out by the authentication server for repeated authentication requests
         (applicable when running several tests in quick succession, e.g. in a loop).
+    pretty : boolean, optional
+        To specify if a pandas Styler, supporting custom CSS styling, is to be returned.
+        This is considerably slower to render for large matrices. False by default.
 
     Note
     ----
     Only the latest score entry from specified input for a particular
-    model instance and test instance combination will be selectedself.
+    model instance and test instance combination will be selected.
     To get the raw (unstyled) dataframe, use :meth:`get_raw_dataframe()`
 
+    By default, a :class:`ScoreMatrix` is returned instead of a pandas Styler (as was the
+    case in earlier versions). Styler methods, such as `highlight_max()` or `to_excel()`,
+    are therefore only available with `pretty=True`, or via the `style` attribute of the
+    :class:`ScoreMatrix` (e.g. `score_matrix.style.highlight_max()`).
+
     Returns
     -------
-    pandas.io.formats.style.Styler
-        A 2-dimensional matrix representation of the scores
+    ScoreMatrix or pandas.io.formats.style.Styler
+        A 2-dimensional matrix representation of the scores (a Styler if `pretty` is True)
     list
         List of entries from specified input that could not be resolved and thus ignored
 
     Examples
     --------
     >>> result_list = ["a618a6b1-e92e-4ac6-955a-7b8c6859285a", "793e5852-761b-4801-84cb-53af6f6c1acf"]
-    >>> styled_df, excluded = utils.generate_score_matrix(username="shailesh", result_list=result_list)
+    >>> score_matrix, excluded = utils.generate_score_matrix(username="shailesh", result_list=result_list)
+    >>> styled_df, excluded = utils.generate_score_matrix(username="shailesh", result_list=result_list, pretty=True)
     """
 
     try:
@@ -1164,15 +1393,19 @@ def generate_score_matrix(
         print("Please install the following package: pandas")
         return
 
-    if client_obj:
-        model_catalog = ModelCatalog.from_existing(client_obj)
-    else:
-        model_catalog = ModelCatalog(username, password, environment=environment)
-
-    if client_obj:
-        test_library = TestLibrary.from_existing(client_obj)
-    else:
-        test_library = TestLibrary(username, password, environment=environment)
+    # check the result UUIDs locally, to fail fast without any requests to the server
+    for r_id in result_list:
+        try:
+            uuid.UUID(str(r_id))
+        except ValueError:
+            raise ValueError("'{}' in result_list is not a valid result UUID.".format(r_id)) from None
+    # copies are made as these lists are extended below, and the default arguments must not change
+    model_instance_list = list(model_instance_list)
+    test_instance_list = list(test_instance_list)
+    result_list = list(result_list)
+
+    model_catalog = _get_client(ModelCatalog, username, password, environment, client_obj)
+    test_library = TestLibrary.from_existing(model_catalog)
 
     # retrieve all model instances from specified models
     if model_list:
@@ -1197,100 +1430,156 @@ def generate_score_matrix(
                 test_instance_list.append(item["id"])
 
     # extend results list to include all results corresponding to above
-    # identified model instances and test instances
-    for item in model_instance_list:
-        results_json = test_library.list_results(model_instance_id=item)["results"]
-        result_list.extend([r["id"] for r in results_json])
-    for item in test_instance_list:
-        results_json = test_library.list_results(test_instance_id=item)["results"]
-        result_list.extend([r["id"] for r in results_json])
+    # identified model instances and test instances (retrieved concurrently)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        model_instance_results = executor.map(
+            lambda item: test_library.list_results(model_instance_id=item)["results"], model_instance_list
+        )
+        test_instance_results = executor.map(
+            lambda item: test_library.list_results(test_instance_id=item)["results"], test_instance_list
+        )
+        for results_json in list(model_instance_results) + list(test_instance_results):
+            result_list.extend([r["id"] for r in results_json])
 
     # remove duplicate result UUIDs
-    result_list = list(collections.OrderedDict.fromkeys(result_list).keys())
+    result_list = list(dict.fromkeys(result_list))
+
+    results_dict = {}
+    model_instances_dict = {}
+    test_instances_dict = {}
 
-    results_dict = collections.OrderedDict()
-    model_instances_dict = collections.OrderedDict()
-    test_instances_dict = collections.OrderedDict()
+    # each result is a separate request, so these are retrieved concurrently
+    results = _fetch_concurrently(lambda r_id: test_library.get_result(result_id=r_id), result_list)
 
     excluded_results = []  # not latest entry for a particular model instance and test instance combination
-    for r_id in result_list:
-        result = test_library.get_result(result_id=r_id)
+    for r_id, result in results.items():
+        model_inst_id = result["model_instance_id"]
+        test_inst_id = result["test_instance_id"]
+        timestamp = result["timestamp"]
         temp_score = round(float(result["score"]), round_places) if round_places else result["score"]
-        # '#*#' is used as separator between score and result UUID (latter used for constructing hyperlink)
-        if result["test_instance_id"] in results_dict.keys():
-            if result["model_instance_id"] not in results_dict[result["test_instance_id"]].keys():
-                results_dict[result["test_instance_id"]][result["model_instance_id"]] = [
-                    result["timestamp"],
-                    str(temp_score) + "#*#" + r_id,
-                ]
-            elif result["timestamp"] > results_dict[result["test_instance_id"]][result["model_instance_id"]][0]:
-                excluded_results.append(
-                    results_dict[result["test_instance_id"]][result["model_instance_id"]][1].split("#*#")[1]
-                )
-                results_dict[result["test_instance_id"]][result["model_instance_id"]] = [
-                    result["timestamp"],
-                    str(temp_score) + "#*#" + r_id,
-                ]
-            else:
-                excluded_results.append(r_id)
+        # score and result UUID are kept apart until selection of the latest entries is done
+        entry = (timestamp, temp_score, r_id)
+        test_results = results_dict.setdefault(test_inst_id, {})
+        if model_inst_id not in test_results:
+            test_results[model_inst_id] = entry
+        elif timestamp > test_results[model_inst_id][0]:
+            excluded_results.append(test_results[model_inst_id][2])
+            test_results[model_inst_id] = entry
         else:
-            results_dict[result["test_instance_id"]] = {
-                result["model_instance_id"]: [
-                    result["timestamp"],
-                    str(temp_score) + "#*#" + r_id,
-                ]
-            }
-
-        if result["model_instance_id"] not in model_instances_dict.keys():
-            model_instances_dict[result["model_instance_id"]] = None
-        if result["test_instance_id"] not in model_instances_dict.keys():
-            test_instances_dict[result["test_instance_id"]] = None
+            excluded_results.append(r_id)
+
+        model_instances_dict.setdefault(model_inst_id, None)
+        test_instances_dict.setdefault(test_inst_id, None)
+
+    # update results_dict values to contain only scores and result UUIDs; remove timestamps
+    # '#*#' is used as separator between score and result UUID (latter used for constructing hyperlink)
+    for test_results in results_dict.values():
+        for key_model_inst, (timestamp, score, r_id) in test_results.items():
+            test_results[key_model_inst] = f"{score}#*#{r_id}"
+
+    # several instances will often belong to the same test/model, so we retrieve the
+    # metadata level by level, and retrieve each entry only once; the test and model
+    # lookups are independent, so at each level both are submitted before waiting on either
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        test_instances = executor.map(
+            lambda instance_id: test_library.get_test_instance(instance_id=instance_id), test_instances_dict
+        )
+        model_instances = executor.map(
+            lambda instance_id: model_catalog.get_model_instance(instance_id=instance_id), model_instances_dict
+        )
+        test_instances = dict(zip(test_instances_dict, test_instances))
+        model_instances = dict(zip(model_instances_dict, model_instances))
 
-    # update results_dict values to contain only scores; remove timestamps
-    for key_test_inst in results_dict.keys():
-        for key_model_inst, value in results_dict[key_test_inst].items():
-            results_dict[key_test_inst][key_model_inst] = value[1]
+        test_ids = list(dict.fromkeys(test_instance["test_id"] for test_instance in test_instances.values()))
+        model_ids = list(dict.fromkeys(model_instance["model_id"] for model_instance in model_instances.values()))
+        tests = executor.map(lambda test_id: test_library.get_test_definition(test_id=test_id), test_ids)
+        models = executor.map(lambda model_id: model_catalog.get_model(model_id=model_id), model_ids)
+        tests = dict(zip(test_ids, tests))
+        models = dict(zip(model_ids, models))
 
     # form test labels: test_name(version_name)
-    for t_id in test_instances_dict.keys():
-        test = test_library.get_test_instance(instance_id=t_id)
-        test_version = test["version"]
-        test = test_library.get_test_definition(test_id=test["test_id"])
+    for t_id, test_instance in test_instances.items():
+        test = tests[test_instance["test_id"]]
         test_name = test["alias"] if test["alias"] else test["name"]
-        test_label = test_name + " (" + str(test_version) + ")"
+        test_label = test_name + " (" + str(test_instance["version"]) + ")"
         test_instances_dict[t_id] = test_label
 
     # form model labels: model_name(version_name)
-    for m_id in model_instances_dict.keys():
-        model = model_catalog.get_model_instance(instance_id=m_id)
-        model_version = model["version"]
-        model = model_catalog.get_model(model_id=model["model_id"])
+    for m_id, model_instance in model_instances.items():
+        model = models[model_instance["model_id"]]
         model_name = model["alias"] if model["alias"] else model["name"]
-        model_label = model_name + "(" + str(model_version) + ")"
+        model_label = model_name + "(" + str(model_instance["version"]) + ")"
         model_instances_dict[m_id] = model_label
 
-    data = {}
-    for t_key, t_val in test_instances_dict.items():
-        score_vals = []
-        for m_key in model_instances_dict.keys():
-            try:
-                score_vals.append(results_dict[t_key][m_key])
-            except KeyError:
-                score_vals.append(None)
-        data[t_val] = score_vals
-    df = pd.DataFrame(data, index=model_instances_dict.values())
-
-    def make_clickable(value):
-        if not value:
-            return value
-        score, result_uuid = value.split("#*#")
-        if show_links:
-            result_url = "https://model-catalog.apps.ebrains.eu/#result_id.{}".format(result_uuid)
-            return '<a target="_blank" href="{}">{}</a>'.format(result_url, score)
-        else:
-            return score
+    # one column per test instance; cells without a result are set to None
+    data = {
+        t_val: [results_dict[t_key].get(m_key) for m_key in model_instances_dict]
+        for t_key, t_val in test_instances_dict.items()
+    }
+    # object dtype keeps empty cells as None (newer pandas would otherwise convert them to NaN)
+    df = pd.DataFrame(data, index=model_instances_dict.values(), dtype=object)
+
+    make_clickable = _get_score_formatter(show_links)
+    if pretty:
+        return df.style.format(make_clickable), excluded_results
+    return ScoreMatrix(df, make_clickable), excluded_results
+
+
+def _get_score_formatter(show_links):
+    """
+    Returns the formatter for the "score#*#result_uuid" cells of the score matrix;
+    it is called for every cell, so the choice of output is made only once.
+    """
+    if show_links:
+        result_url_prefix = "https://model-catalog.apps.ebrains.eu/#result_id."
+
+        def make_clickable(value):
+            if not value or not isinstance(value, str):
+                return value
+            score, result_uuid = value.split("#*#", 1)
+            return f'<a target="_blank" href="{result_url_prefix}{result_uuid}">{score}</a>'
+
+    else:
 
-    return df.style.format(make_clickable), excluded_results
+        def make_clickable(value):
+            if not value or not isinstance(value, str):
+                return value
+            return value.split("#*#", 1)[0]
+
+    return make_clickable
+
+
+class ScoreMatrix(object):
+    """Score matrix generated by :meth:`generate_score_matrix`
+
+    Rendered as a plain HTML table (e.g. inside Jupyter notebooks), without the
+    overhead of a pandas Styler. As for the latter, the underlying DataFrame is
+    available as `data`, and can be processed via :meth:`get_raw_dataframe`.
+    """
+
+    def __init__(self, data, formatter):
+        self.data = data
+        self.formatter = formatter
+
+    @property
+    def style(self):
+        """pandas Styler for the score matrix, for applying custom CSS styling"""
+        return self.data.style.format(self.formatter)
+
+    def to_html(self, buf=None, **kwargs):
+        kwargs.setdefault("escape", False)
+        na_rep = kwargs.pop("na_rep", "")
+        # cells without a result (None) are filled beforehand, as pandas renders them as "None"
+        # without calling the formatter
+        data = self.data.where(self.data.notna(), na_rep)
+
+        def format_cell(value):
+            return self.formatter(value) if "#*#" in value else value
+
+        return data.to_html(buf, formatters=[format_cell] * len(data.columns), **kwargs)
+
+    def _repr_html_(self):
+        return self.to_html()
 
 
 def get_raw_dataframe(styled_df):
@@ -1303,7 +1592,7 @@ def get_raw_dataframe(styled_df):
 
     Parameters
     ----------
-    styled_df : pandas.io.formats.style.Styler
+    styled_df : ScoreMatrix or pandas.io.formats.style.Styler
         Styled DataFrame object generated by :meth`generate_score_matrix`
 
     Returns
@@ -1317,10 +1606,14 @@ def get_raw_dataframe(styled_df):
     """
 
     def make_raw_scores(value):
-        if value:
-            return value.split("#*#")[0]
+        if value and isinstance(value, str):
+            return value.split("#*#", 1)[0]
 
-    return styled_df.data.applymap(make_raw_scores)
+    # `DataFrame.applymap` was renamed to `DataFrame.map` in pandas 2.1, and later removed
+    df = styled_df.data
+    if hasattr(df, "map"):
+        return df.map(make_raw_scores)
+    return df.applymap(make_raw_scores)
 
 
 def display_score_matrix_html(styled_df=None, df=None):
@@ -1332,7 +1625,7 @@ def display_score_matrix_html(styled_df=None, df=None):
 
     Parameters
     ----------
-    styled_df : pandas.io.formats.style.Styler
+    styled_df : ScoreMatrix or pandas.io.formats.style.Styler
         Styled DataFrame object generated by :meth`generate_score_matrix`
     df : pandas.core.frame.DataFrame
         DataFrame object generated by :meth`get_raw_dataframe`
@@ -1347,6 +1640,8 @@ def display_score_matrix_html(styled_df=None, df=None):
     >>> utils.display_score_matrix_html(styled_df)
     """
 
+    import webbrowser
+
     if styled_df is None and df is None:
         raise Exception("styled_df or df needs to be provided for displaying the score matrix.")
 
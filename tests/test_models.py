@@ -1,10 +1,9 @@
 import platform
 import uuid
 from datetime import datetime
-from time import sleep
 
 import pytest
-from .conftest import TESTING_COLLAB
+from .conftest import TESTING_COLLAB, _wait_for
 
 """
 1] Retrieve a model description by its model_id or alias.
@@ -28,11 +27,10 @@ def test_getModel_id(modelCatalog, myModelID):
 
 # 1.3) Using alias
 def test_getModel_alias(modelCatalog, myModelID):
-    sleep(60)  # time for KG indexing
     model_catalog = modelCatalog
     model_id = myModelID
     model = model_catalog.get_model(model_id=model_id)
-    model = model_catalog.get_model(alias=model["alias"])
+    model = _wait_for(lambda: model_catalog.get_model(alias=model["alias"]))  # time for KG indexing
     assert model["id"] == model_id
 
 
@@ -322,7 +320,7 @@ def test_addModel_repeat_alias_nodetails(modelCatalog):
         license="BSD 3-Clause",
         description="This is a test entry! Please ignore.",
     )
-    sleep(30)
+    _wait_for(lambda: model_catalog.get_model(alias=model_name))
     with pytest.raises(Exception) as excinfo:
         model = model_catalog.register_model(
             collab_id=TESTING_COLLAB,
@@ -496,8 +494,8 @@ def test_editModel_invalid_duplicate_alias(modelCatalog):
         license="BSD 3-Clause",
         description="This is a test entry! Please ignore.",
     )
-    sleep(20)
-    model = model_catalog.get_model(model_id=model2["id"])
+    _wait_for(lambda: model_catalog.get_model(alias=model_name1))
+    model = _wait_for(lambda: model_catalog.get_model(model_id=model2["id"]))
     with pytest.raises(Exception) as excinfo:
         model = model_catalog.edit_model(
             model_id=model["id"],
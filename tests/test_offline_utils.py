@@ -0,0 +1,442 @@
+import base64
+import json
+import pickle
+import time
+
+import ebrains_validation_framework
+from ebrains_validation_framework import ModelCatalog, ResponseError, datastores, utils
+
+import pytest
+
+
+def _make_token(expiry):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expiry}).encode()).decode().rstrip("=")
+    return "header.{}.signature".format(payload)
+
+
+class DummyClient(object):
+    instances = 0
+
+    def __init__(self, username, password, environment="production"):
+        DummyClient.instances += 1
+        self.username = username
+        self.environment = environment
+        self.token = _make_token(time.time() + 3600)
+
+    @classmethod
+    def from_existing(cls, client):
+        obj = cls.__new__(cls)
+        obj.username = client.username
+        obj.environment = client.environment
+        obj.token = client.token
+        return obj
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    monkeypatch.setattr(utils, "_clients", {})
+    DummyClient.instances = 0
+    return utils._clients
+
+
+"""
+1] Tests `_token_expired`
+"""
+
+
+# 1.1) Token that cannot be decoded
+@pytest.mark.parametrize("token", [None, "", "abcde", "header.not-base64!.signature", "header.eyJleHAiOj.signature"])
+def test_token_expired_undecodable(token):
+    assert utils._token_expired(token)
+
+
+# 1.2) Token without expiry time
+def test_token_expired_no_exp():
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "tester"}).encode()).decode()
+    assert utils._token_expired("header.{}.signature".format(payload))
+
+
+# 1.3) Expired token, and token expiring within the margin
+def test_token_expired_past():
+    assert utils._token_expired(_make_token(time.time() - 10))
+    assert utils._token_expired(_make_token(time.time() + 30), margin=60)
+
+
+# 1.4) Valid token
+def test_token_expired_valid():
+    assert not utils._token_expired(_make_token(time.time() + 3600))
+
+
+"""
+2] Tests `_get_client`
+"""
+
+
+# 2.1) Client reused for same username and environment, regardless of password
+def test_get_client_reuse(clients):
+    client1 = utils._get_client(DummyClient, "tester", "secret", "production")
+    client2 = utils._get_client(DummyClient, "tester", "other", "production")
+    assert DummyClient.instances == 1
+    assert client1 is not client2
+    assert client1.token == client2.token
+    assert list(clients) == [("tester", "production")]
+
+
+# 2.2) New client for a different username or environment
+def test_get_client_different_key(clients):
+    utils._get_client(DummyClient, "tester", "secret", "production")
+    utils._get_client(DummyClient, "tester", "secret", "dev")
+    utils._get_client(DummyClient, "other", "secret", "production")
+    assert DummyClient.instances == 3
+    assert len(clients) == 3
+
+
+# 2.3) Cached client replaced once its token has expired
+def test_get_client_expired(clients):
+    utils._get_client(DummyClient, "tester", "secret", "production")
+    expired = clients[("tester", "production")]
+    expired.token = _make_token(time.time() - 10)
+    client = utils._get_client(DummyClient, "tester", "secret", "production")
+    assert DummyClient.instances == 2
+    assert clients[("tester", "production")] is not expired
+    assert not utils._token_expired(client.token)
+
+
+# 2.4) Client derived from `client_obj` without using the cache
+def test_get_client_from_client_obj(clients):
+    existing = DummyClient("tester", "secret")
+    client = utils._get_client(DummyClient, "someone", "else", "production", client_obj=existing)
+    assert DummyClient.instances == 1
+    assert client.token == existing.token
+    assert clients == {}
+
+
+"""
+3] Tests `_save_test_result` and `_load_test_result`
+"""
+
+SCORE = {"score": 0.75, "related_data": {"figures": ["fig.png"]}}
+
+
+# 3.1) Uncompressed pickle file
+def test_save_load_test_result_plain(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "zstandard", None)
+    file_path = utils._save_test_result(SCORE, tmp_path / "result.pkl")
+    assert file_path.name == "result.pkl"
+    with open(file_path, "rb") as fp:
+        assert pickle.load(fp) == SCORE
+    assert utils._load_test_result(file_path) == SCORE
+
+
+# 3.2) Compressed pickle file
+def test_save_load_test_result_compressed(tmp_path):
+    pytest.importorskip("zstandard")
+    file_path = utils._save_test_result(SCORE, tmp_path / "result.pkl")
+    assert file_path.name == "result.pkl.zst"
+    with open(file_path, "rb") as fp:
+        assert fp.read(4) == utils._ZSTD_MAGIC
+    assert utils._load_test_result(file_path) == SCORE
+
+
+# 3.3) Pickle file written by earlier versions, loaded when zstandard is available
+def test_load_test_result_legacy(tmp_path):
+    file_path = tmp_path / "result.pkl"
+    with open(file_path, "wb") as fp:
+        pickle.dump(SCORE, fp)
+    assert utils._load_test_result(file_path) == SCORE
+
+
+# 3.4) Compressed file, loaded without zstandard
+def test_load_test_result_compressed_without_zstandard(tmp_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    file_path = utils._save_test_result(SCORE, tmp_path / "result.pkl")
+    monkeypatch.setattr(utils, "zstandard", None)
+    with pytest.raises(ImportError) as excinfo:
+        utils._load_test_result(file_path)
+    assert "zstandard" in str(excinfo.value)
+
+
+"""
+4] Tests caching of attribute options
+"""
+
+
+class DummyResponse(object):
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.text = json.dumps(data)
+
+    def json(self):
+        return self.data
+
+
+class DummySession(object):
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+
+def _make_model_catalog(session):
+    model_catalog = ModelCatalog.__new__(ModelCatalog)
+    model_catalog.url = "https://example.org"
+    model_catalog.auth = None
+    model_catalog.verify = True
+    model_catalog.session = session
+    model_catalog._vocab_cache = {}
+    return model_catalog
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ebrains_validation_framework.time, "monotonic", lambda: now[0])
+    return now
+
+
+# 4.1) Repeated calls are served from the cache, as copies
+def test_attribute_options_cached(clock):
+    session = DummySession(DummyResponse(200, {"species": ["Mus musculus"]}))
+    model_catalog = _make_model_catalog(session)
+    data = model_catalog.get_attribute_options()
+    data["species"].append("changed")
+    assert model_catalog.get_attribute_options() == {"species": ["Mus musculus"]}
+    assert session.urls == ["https://example.org/vocab/"]
+
+
+# 4.2) Cached values are retrieved again once expired
+def test_attribute_options_expired(clock):
+    session = DummySession(
+        DummyResponse(200, {"species": ["Mus musculus"]}),
+        DummyResponse(200, {"species": ["Rattus norvegicus"]}),
+    )
+    model_catalog = _make_model_catalog(session)
+    model_catalog.get_attribute_options("species")
+    clock[0] += ebrains_validation_framework.VOCAB_CACHE_TTL + 1
+    assert model_catalog.get_attribute_options("species") == {"species": ["Rattus norvegicus"]}
+    assert len(session.urls) == 2
+
+
+# 4.3) Error responses are raised, and not cached
+def test_attribute_options_error_not_cached(clock):
+    session = DummySession(
+        DummyResponse(503, {"detail": "Service unavailable"}),
+        DummyResponse(200, {"species": ["Mus musculus"]}),
+    )
+    model_catalog = _make_model_catalog(session)
+    with pytest.raises(ResponseError) as excinfo:
+        model_catalog.get_attribute_options()
+    assert excinfo.value.status_code == 503
+    assert model_catalog._vocab_cache == {}
+    assert model_catalog.get_attribute_options() == {"species": ["Mus musculus"]}
+    assert len(session.urls) == 2
+
+
+"""
+5] Tests `HTTPDataStore.download_data`
+"""
+
+
+# 5.1) URLs with the same target path are downloaded only once; the last one is kept
+def test_http_download_duplicate_targets(tmp_path, monkeypatch):
+    downloads = []
+
+    def urlretrieve(url, local_path):
+        downloads.append((url, local_path))
+        return local_path, {}
+
+    monkeypatch.setattr(datastores, "urlretrieve", urlretrieve)
+    monkeypatch.setattr(datastores.requests, "head", lambda url: DummyResponse(200, {}))
+    remote_paths = ["http://a.org/f.txt", "http://b.org/f.txt", "http://a.org/g.txt"]
+    with pytest.warns(UserWarning, match="same target path"):
+        local_paths = datastores.HTTPDataStore().download_data(remote_paths, local_directory=str(tmp_path))
+    f_path, g_path = str(tmp_path / "f.txt"), str(tmp_path / "g.txt")
+    assert local_paths == [f_path, f_path, g_path]
+    assert sorted(downloads) == [("http://a.org/g.txt", g_path), ("http://b.org/f.txt", f_path)]
+
+
+"""
+6] Tests `ScoreMatrix`
+"""
+
+
+@pytest.fixture
+def score_matrix():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {"Test A (1.0)": ["0.5#*#uuid-1", None], "Test B (2.0)": [None, "1.25#*#uuid-2"]},
+        index=["Model X(1)", "Model Y(2)"],
+        dtype=object,
+    )
+    return utils.ScoreMatrix(df, utils._get_score_formatter(show_links=True))
+
+
+# 6.1) Rendered as HTML table, with links to results and empty cells
+def test_score_matrix_html(score_matrix):
+    html = score_matrix.to_html()
+    assert html == score_matrix._repr_html_()
+    assert '<a target="_blank" href="https://model-catalog.apps.ebrains.eu/#result_id.uuid-1">0.5</a>' in html
+    assert '<a target="_blank" href="https://model-catalog.apps.ebrains.eu/#result_id.uuid-2">1.25</a>' in html
+    assert html.count("<td></td>") == 2
+    assert "#*#" not in html and "None" not in html and "nan" not in html
+
+
+# 6.2) Without links
+def test_score_matrix_html_no_links(score_matrix):
+    score_matrix.formatter = utils._get_score_formatter(show_links=False)
+    html = score_matrix.to_html()
+    assert "<a " not in html
+    assert "<td>0.5</td>" in html and "<td>1.25</td>" in html
+
+
+# 6.3) Styler available via `style`
+def test_score_matrix_style(score_matrix):
+    pytest.importorskip("jinja2")
+    from pandas.io.formats.style import Styler
+
+    styler = score_matrix.style
+    assert isinstance(styler, Styler)
+    assert styler.data is score_matrix.data
+    assert "#result_id.uuid-1" in styler.to_html()
+
+
+# 6.4) Raw DataFrame of scores
+def test_score_matrix_raw_dataframe(score_matrix):
+    df = utils.get_raw_dataframe(score_matrix)
+    assert df.loc["Model X(1)", "Test A (1.0)"] == "0.5"
+    assert df.loc["Model Y(2)", "Test B (2.0)"] == "1.25"
+    assert df.isna().loc["Model X(1)", "Test B (2.0)"]
+    assert list(df.columns) == ["Test A (1.0)", "Test B (2.0)"]
+
+
+"""
+7] Tests local validation of UUIDs
+"""
+
+
+# 7.1) Invalid model_id format in `get_model`, without any request to the server
+@pytest.mark.parametrize("model_id", ["abcde", "1234-5678"])
+def test_get_model_invalid_id_format(model_id):
+    model_catalog = _make_model_catalog(DummySession())
+    with pytest.raises(ValueError) as excinfo:
+        model_catalog.get_model(model_id=model_id)
+    assert "Error in retrieving model." in str(excinfo.value)
+    assert excinfo.value.__cause__ is None and excinfo.value.__suppress_context__
+    assert model_catalog.session.urls == []
+
+
+# 7.2) Invalid result UUID in `generate_score_matrix`, before authenticating
+def test_generate_score_matrix_invalid_result_id(clients):
+    pytest.importorskip("pandas")
+    result_list = ["a618a6b1-e92e-4ac6-955a-7b8c6859285a", "abcde"]
+    with pytest.raises(ValueError) as excinfo:
+        utils.generate_score_matrix(username="tester", result_list=result_list)
+    assert str(excinfo.value) == "'abcde' in result_list is not a valid result UUID."
+    assert excinfo.value.__suppress_context__
+    assert clients == {}
+
+
+"""
+8] Tests handling of errors raised when retrieving results for `generate_HTML_report`
+"""
+
+VALID_RESULT_ID = "a618a6b1-e92e-4ac6-955a-7b8c6859285a"
+UNKNOWN_RESULT_ID = "0b6f2e0c-2b5c-4c53-9a43-1e3e2d7a5f11"
+
+
+class DummyLibrary(object):
+    """Serves as both ModelCatalog and TestLibrary; `errors` maps result ids to the status code to be raised."""
+
+    def __init__(self, errors):
+        self.errors = errors
+
+    @classmethod
+    def from_existing(cls, client):
+        return client
+
+    def get_result(self, result_id):
+        if result_id in self.errors:
+            raise ResponseError("Error in retrieving result", status_code=self.errors[result_id])
+        return {"id": result_id, "model_instance_id": "mi-1", "test_instance_id": "ti-1", "score": 0.5}
+
+    def get_model_instance(self, instance_id):
+        return {"id": instance_id, "model_id": "model-1", "version": "1"}
+
+    def get_test_instance(self, instance_id):
+        return {"id": instance_id, "test_id": "test-1", "version": "1.0"}
+
+    def get_model(self, model_id):
+        return {"id": model_id, "alias": None, "name": "Model X"}
+
+    def get_test_definition(self, test_id):
+        return {"id": test_id, "alias": None, "name": "Test A"}
+
+
+def _generate_HTML_report(monkeypatch, errors):
+    pytest.importorskip("jinja2")
+    monkeypatch.setattr(utils, "ModelCatalog", DummyLibrary)
+    monkeypatch.setattr(utils, "TestLibrary", DummyLibrary)
+    return utils.generate_HTML_report(
+        result_list=[VALID_RESULT_ID, UNKNOWN_RESULT_ID], client_obj=DummyLibrary(errors)
+    )
+
+
+# 8.1) Unknown or malformed result UUIDs are excluded from the report
+@pytest.mark.parametrize("status_code", [400, 404, 422])
+def test_generate_HTML_report_invalid_result(tmp_path, monkeypatch, capsys, status_code):
+    monkeypatch.chdir(tmp_path)
+    report_path, valid_result_uuids = _generate_HTML_report(monkeypatch, {UNKNOWN_RESULT_ID: status_code})
+    assert valid_result_uuids == [VALID_RESULT_ID]
+    assert UNKNOWN_RESULT_ID in capsys.readouterr().out
+    assert VALID_RESULT_ID in (tmp_path / report_path).read_text()
+
+
+# 8.2) Other errors (e.g. authorization, server errors) are raised
+@pytest.mark.parametrize("status_code", [401, 500])
+def test_generate_HTML_report_error_raised(tmp_path, monkeypatch, status_code):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ResponseError) as excinfo:
+        _generate_HTML_report(monkeypatch, {UNKNOWN_RESULT_ID: status_code})
+    assert excinfo.value.status_code == status_code
+    assert list(tmp_path.iterdir()) == []
+
+
+"""
+9] Tests loading of observation data for `run_test_offline`
+"""
+
+OBSERVATION = {"mean": 0.25, "std": 1.5, "n": 10, "units": "mV"}
+
+
+# 9.1) JSON file below `_LARGE_JSON_SIZE`, parsed in one go
+def test_load_observation_json(tmp_path):
+    observation_path = tmp_path / "observation.json"
+    observation_path.write_text(json.dumps(OBSERVATION))
+    assert utils._load_observation(observation_path) == OBSERVATION
+
+
+# 9.2) JSON file above `_LARGE_JSON_SIZE`, parsed incrementally by ijson, with floats (not Decimals)
+def test_load_observation_large_json(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(utils, "_LARGE_JSON_SIZE", 16)
+
+    def fail(data):
+        raise AssertionError("large observation file should not be read in one go")
+
+    monkeypatch.setattr(utils, "_json_loads", fail)
+    observation_path = tmp_path / "observation.json"
+    observation_path.write_text(json.dumps(OBSERVATION))
+    observation_data = utils._load_observation(observation_path)
+    assert observation_data == OBSERVATION
+    assert type(observation_data["mean"]) is float and type(observation_data["n"]) is int
+
+
+# 9.3) Other file types returned as bytes
+def test_load_observation_other(tmp_path):
+    observation_path = tmp_path / "observation.csv"
+    observation_path.write_bytes(b"mean,std\n0.25,1.5\n")
+    assert utils._load_observation(observation_path) == b"mean,std\n0.25,1.5\n"